@@ -1,14 +1,34 @@
 import dash
 from dash import dcc, html, Input, Output, State, callback
-import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 import dash_bootstrap_components as dbc
 from openai import OpenAI
+import diskcache
+import functools
+import hashlib
+import json
 import os
+import re
+import plotly.io.json as pio_json
+from plotly.io.json import to_json_plotly
 
-# Initialize the Dash app
-app = dash.Dash(__name__)
+# Strip comments and redundant whitespace from an inline <style> block
+def minify_css(css):
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+# Serialize callback outputs with orjson
+pio_json.config.default_engine = 'orjson'
+
+# Background callback manager for the OpenAI chat round-trip
+background_callback_manager = dash.DiskcacheManager(diskcache.Cache('./cache'))
+
+# Initialize the Dash app (gzip-compressed responses)
+app = dash.Dash(__name__, background_callback_manager=background_callback_manager, compress=True)
 app.title = "3D Printing Construction Database"
 
 # PRODUCTION: Updated API key loading for deployment
@@ -21,38 +41,104 @@ def load_api_key():
         # Fallback to file (for local development)
         with open('../API.txt', 'r') as f:
             return f.read().strip()
-    except:
+    except (OSError, UnicodeDecodeError):
         return None
 
+# Read once at startup; a new key needs a restart, as with any other config
+_API_KEY = load_api_key()
+
+# Built once at import; background chat jobs inherit it when they fork
+_OPENAI_CLIENT = OpenAI(api_key=_API_KEY, timeout=30.0) if _API_KEY else None
+
+# CSV columns the dashboard reads (both spellings of the description header)
+_CSV_COLUMNS = frozenset([
+    'Project', 'Year', 'City', 'Country', 'Material', 'Organization',
+    'Descrtiption', 'Description', 'Link', 'Latitude', 'Longitude'
+])
+
+# Source data and the pickled prepared frame, rebuilt when the CSV or this module is newer
+_DATA_CSV = 'projects.csv'
+_DATA_CACHE = 'projects.pkl'
+
+def load_cached_data():
+    try:
+        source_mtime = max(os.path.getmtime(_DATA_CSV), os.path.getmtime(__file__))
+        if os.path.getmtime(_DATA_CACHE) >= source_mtime:
+            return pd.read_pickle(_DATA_CACHE)
+    except Exception:
+        pass  # Missing, stale or unreadable cache - fall back to the CSV
+    return None
+
 # Load data
 def load_data():
     try:
-        df = pd.read_csv('projects.csv')
-        df = df.copy()
+        df = load_cached_data()
+        if df is not None:
+            return df
+        df = pd.read_csv(_DATA_CSV, usecols=lambda col: col in _CSV_COLUMNS)
         df = df.dropna(subset=['Project', 'Year', 'Country', 'Material', 'Organization'])
         df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
         df = df.dropna(subset=['Year'])
         df = df.reset_index(drop=True)
+        if not df.empty:
+            raw_bytes = df.memory_usage(deep=True).sum()
+            df = prepare_data(df)
+            print(f"Prepared data: {raw_bytes:,} -> {df.memory_usage(deep=True).sum():,} bytes in memory")
+        # Write beside the cache and swap it in, so other workers never read a partial file
+        tmp_cache = f"{_DATA_CACHE}.{os.getpid()}.tmp"
+        try:
+            df.to_pickle(tmp_cache)
+            os.replace(tmp_cache, _DATA_CACHE)
+        except OSError as e:
+            print(f"Could not write data cache: {e}")
+            try:
+                os.remove(tmp_cache)
+            except OSError:
+                pass
         return df
     except Exception as e:
         print(f"Error loading data: {e}")
         return pd.DataFrame()
 
-# Categorize materials
-def categorize_material(material):
-    material_lower = str(material).lower()
-    if any(term in material_lower for term in ['concrete', 'cement']):
-        return 'Concrete/Cement'
-    elif any(term in material_lower for term in ['ceramic', 'clay']):
-        return 'Ceramics/Clay'
-    elif 'composite' in material_lower:
-        return 'Composite'
-    elif any(term in material_lower for term in ['plastic', 'polymer']):
-        return 'Plastic/Polymer'
-    elif 'metal' in material_lower:
-        return 'Metal'
-    else:
-        return 'Other/Experimental'
+# Material categories in priority order - the first matching pattern wins
+_MATERIAL_CATEGORIES = (
+    ('Concrete/Cement', 'concrete|cement'),
+    ('Ceramics/Clay', 'ceramic|clay'),
+    ('Composite', 'composite'),
+    ('Plastic/Polymer', 'plastic|polymer'),
+    ('Metal', 'metal')
+)
+
+# Categorize materials (vectorized over the whole column)
+def categorize_materials(materials):
+    materials_lower = materials.astype(str).str.lower()
+    conditions = [materials_lower.str.contains(pattern) for _, pattern in _MATERIAL_CATEGORIES]
+    choices = [category for category, _ in _MATERIAL_CATEGORIES]
+    return np.select(conditions, choices, default='Other/Experimental')
+
+# Filter command patterns, compiled once at import
+_MATERIAL_KEYWORDS = {
+    'concrete': 'Concrete/Cement',
+    'cement': 'Concrete/Cement',
+    'ceramic': 'Ceramics/Clay',
+    'clay': 'Ceramics/Clay',
+    'composite': 'Composite',
+    'plastic': 'Plastic/Polymer',
+    'polymer': 'Plastic/Polymer',
+    'metal': 'Metal',
+    'experimental': 'Other/Experimental'
+}
+_MATERIAL_KEYWORD_RE = re.compile('|'.join(_MATERIAL_KEYWORDS))
+_RANGE_PATTERNS = [re.compile(p) for p in (
+    r'(?:from|between)\s+(\d{4})\s+(?:to|and)\s+(\d{4})',
+    r'(\d{4})\s*[-–]\s*(\d{4})',
+    r'(\d{4})\s+to\s+(\d{4})'
+)]
+_YEAR_RE = re.compile(r'\b(20[0-9]{2}|19[0-9]{2})\b')
+_RESET_KEYWORDS = ('reset', 'clear', 'all projects', 'show all', 'remove filters', 'no filter')
+
+# Every spelling of the chat easter-egg phrase, as one pattern
+_EASTER_EGG_RE = re.compile(r'(?:i am|im) pk and i (?:like|love) pizza hawaii')
 
 # Parse natural language filter commands
 def parse_filter_command(message):
@@ -61,33 +147,13 @@ def parse_filter_command(message):
     commands = {}
     
     # Material filters
-    material_mappings = {
-        'concrete': 'Concrete/Cement',
-        'cement': 'Concrete/Cement',
-        'ceramic': 'Ceramics/Clay',
-        'clay': 'Ceramics/Clay',
-        'composite': 'Composite',
-        'plastic': 'Plastic/Polymer',
-        'polymer': 'Plastic/Polymer',
-        'metal': 'Metal',
-        'experimental': 'Other/Experimental'
-    }
-    
-    for keyword, category in material_mappings.items():
-        if keyword in message_lower:
-            commands['material'] = category
-            break
+    material_match = _MATERIAL_KEYWORD_RE.search(message_lower)
+    if material_match:
+        commands['material'] = _MATERIAL_KEYWORDS[material_match.group(0)]
     
     # Year filters
-    import re
-    range_patterns = [
-        r'(?:from|between)\s+(\d{4})\s+(?:to|and)\s+(\d{4})',
-        r'(\d{4})\s*[-–]\s*(\d{4})',
-        r'(\d{4})\s+to\s+(\d{4})'
-    ]
-    
-    for pattern in range_patterns:
-        range_match = re.search(pattern, message_lower)
+    for pattern in _RANGE_PATTERNS:
+        range_match = pattern.search(message_lower)
         if range_match:
             start_year = int(range_match.group(1))
             end_year = int(range_match.group(2))
@@ -95,7 +161,7 @@ def parse_filter_command(message):
             break
     
     if 'year_range' not in commands:
-        year_matches = re.findall(r'\b(20[0-9]{2}|19[0-9]{2})\b', message)
+        year_matches = _YEAR_RE.findall(message)
         if len(year_matches) >= 2:
             years = [int(y) for y in year_matches[:2]]
             commands['year_range'] = [min(years), max(years)]
@@ -104,17 +170,256 @@ def parse_filter_command(message):
             commands['year_range'] = [year, year]
     
     # Reset command
-    reset_keywords = ['reset', 'clear', 'all projects', 'show all', 'remove filters', 'no filter']
-    if any(keyword in message_lower for keyword in reset_keywords):
+    if any(keyword in message_lower for keyword in _RESET_KEYWORDS):
         commands['reset'] = True
     
     return commands
 
+# Maximum number of projects rendered in the sidebar list
+_MAX_PROJECT_LIST_ITEMS = 100
+
+# Chat exchanges kept in the browser log and shown in the chat display
+_CHAT_VISIBLE_EXCHANGES = 5
+
+# Messages (user and assistant) of conversation memory sent to the model
+_CHAT_HISTORY_LIMIT = 6
+
+# AI replies by (normalized message, prompt digest), shared on disk by the chat jobs
+_CHAT_REPLY_CACHE = diskcache.Cache('./cache/chat-replies')
+_CHAT_REPLY_TTL = 24 * 60 * 60  # Seconds
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Columns matched by the sidebar search
+_SEARCH_COLUMNS = ('Project', 'Organization', 'Country', 'City', 'Material')
+
+# Derived columns, computed before the frame is cached so warm boots skip them
+def prepare_data(df):
+    df['Material_Category'] = categorize_materials(df['Material'])
+    # Single lowercased search haystack, fields joined by a separator no query contains
+    df['_search_blob'] = df[_SEARCH_COLUMNS[0]].fillna('').str.cat(
+        [df[col].fillna('') for col in _SEARCH_COLUMNS[1:]], sep='\x1f'
+    ).str.lower()
+    # Compact dtypes: int16 years and categorical low-cardinality columns
+    df['Year'] = df['Year'].astype(np.int16)
+    for col in ('Material_Category', 'Country', 'Organization', 'City'):
+        df[col] = df[col].astype('category')
+    return df
+
 # Load data
 df = load_data()
-if not df.empty:
-    df = df.copy()
-    df['Material_Category'] = df['Material'].apply(categorize_material)
+
+# Compact column arrays for the filter kernel: int16 years and int8 material codes
+_YEAR_VALUES = df['Year'].to_numpy(np.int16) if not df.empty else np.empty(0, np.int16)
+_MATERIAL_CODES = df['Material_Category'].cat.codes.to_numpy(np.int8) if not df.empty else np.empty(0, np.int8)
+_MATERIAL_CODE_LOOKUP = {category: code for code, category in enumerate(df['Material_Category'].cat.categories)} if not df.empty else {}
+_MATERIAL_CATEGORY_NAMES = df['Material_Category'].cat.categories.to_numpy() if not df.empty else np.empty(0, object)
+
+# Full year span of the data (slider bounds and the chat's reset range)
+_YEAR_MIN = int(_YEAR_VALUES.min()) if not df.empty else 2015
+_YEAR_MAX = int(_YEAR_VALUES.max()) if not df.empty else 2025
+_FULL_YEAR_RANGE = [_YEAR_MIN, _YEAR_MAX]
+
+# Project counts per (year, material category), which the chat summary slices
+_YEAR_MATERIAL_COUNTS = np.zeros((_YEAR_MAX - _YEAR_MIN + 1, len(_MATERIAL_CATEGORY_NAMES)), np.int64)
+np.add.at(_YEAR_MATERIAL_COUNTS, (_YEAR_VALUES.astype(np.intp) - _YEAR_MIN, _MATERIAL_CODES), 1)
+
+# Project name -> row position of its first occurrence, for O(1) panel lookups
+_PROJECT_TO_IDX = pd.Series(np.arange(len(df)), index=df['Project'])[lambda s: ~s.index.duplicated()].to_dict() if not df.empty else {}
+
+# Map hover text for every row: name, organization, location, material, year
+def build_hover_text(rows):
+    year_labels = np.char.add('Year: ', np.char.mod('%d', rows['Year'].to_numpy(np.int32)))
+    return rows['Project'].str.cat([
+        rows['Organization'],
+        rows['City'].str.cat(rows['Country'], sep=', '),
+        rows['Material_Category'].cat.rename_categories(lambda c: 'Material: ' + c),
+        pd.Series(year_labels, index=rows.index, dtype=object)
+    ], sep='<br>').to_numpy()
+
+# Per-row map columns as plain arrays (float32 coordinates are ~1 m precision)
+_LATITUDES = df['Latitude'].to_numpy(np.float32) if not df.empty else np.empty(0, np.float32)
+_LONGITUDES = df['Longitude'].to_numpy(np.float32) if not df.empty else np.empty(0, np.float32)
+_PROJECT_NAMES = df['Project'].to_numpy() if not df.empty else np.empty(0, object)
+_HOVER_TEXT = build_hover_text(df) if not df.empty else np.empty(0, object)
+
+# Trace styles shared by every map and timeline update
+_PROJECT_MARKER = dict(size=10, color='black', opacity=0.8, line=dict(width=1, color='white'))
+_SELECTED_PROJECT_MARKER = dict(
+    size=15,  # 10% larger
+    color='blue',
+    opacity=0.9,  # Slightly more opaque
+    line=dict(width=2, color='white')  # Thicker border
+)
+_TIMELINE_LINE = dict(color='black', width=2)
+_TIMELINE_MARKER = dict(color='black', size=4)
+
+# Static world map layout, sent once with the initial figure
+_MAP_LAYOUT = dict(
+    geo=dict(
+        projection_type='natural earth',
+        showland=True,
+        landcolor='rgb(245,245,245)',
+        showocean=True,
+        oceancolor='rgb(255,255,255)',
+        showlakes=True,
+        lakecolor='rgb(255,255,255)',
+        showrivers=False,
+        showcountries=True,
+        countrycolor='rgb(220,220,220)',
+        coastlinecolor='rgb(220,220,220)',
+        showframe=False,
+        showcoastlines=True
+    ),
+    margin=dict(l=0, r=0, t=0, b=0),
+    height=None,
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)'
+)
+
+# Static timeline layout, sent once with the initial figure
+_TIMELINE_LAYOUT = dict(
+    margin=dict(l=5, r=10, t=5, b=20),
+    height=120,
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    xaxis=dict(
+        showgrid=False,
+        showline=False,
+        title='',
+        tickfont=dict(size=7, color='#333'),
+        color='#333'
+    ),
+    yaxis=dict(
+        showgrid=False,
+        showticklabels=False,
+        showline=False,
+        title='',
+        visible=False
+    )
+)
+
+# Filter columns shipped once with the layout for the clientside filter
+_FILTER_INDEX = {
+    'years': _YEAR_VALUES.tolist(),
+    'materials': _MATERIAL_CODES.tolist(),
+    'categories': _MATERIAL_CATEGORY_NAMES.tolist(),
+    'text': df['_search_blob'].tolist() if not df.empty else []
+}
+
+# Inline styles shared by the sidebar list and panel content builders
+_LIST_ITEM_STYLE = {
+    'padding': '6px 8px',
+    'margin-bottom': '2px',
+    'border-radius': '3px',
+    'cursor': 'pointer',
+    'transition': 'background-color 0.2s',
+    'background-color': 'transparent'
+}
+_SELECTED_LIST_ITEM_STYLE = {**_LIST_ITEM_STYLE, 'background-color': 'rgba(0, 102, 204, 0.1)'}  # HIGHLIGHT SELECTED PROJECT
+_LIST_ITEM_LINK_STYLE = {
+    'font-weight': 'bold',
+    'color': '#0066cc',
+    'cursor': 'pointer',
+    'margin-bottom': '2px'
+}
+_LIST_ITEM_ORG_STYLE = {'color': '#666', 'font-size': '9px'}
+_LIST_ITEM_META_STYLE = {'color': '#888', 'font-size': '8px'}
+_PANEL_TITLE_STYLE = {
+    'color': '#333',
+    'margin-bottom': '20px',
+    'font-size': '24px',
+    'font-weight': 'bold'
+}
+_PANEL_SUBTITLE_STYLE = {
+    'color': '#555',
+    'margin-bottom': '20px',
+    'font-size': '18px',
+    'font-weight': 'normal'
+}
+_SECTION_HEADING_STYLE = {'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}
+_SECTION_TEXT_STYLE = {'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'}
+_FIELD_LABEL_STYLE = {'color': '#333', 'font-size': '12px'}
+_FIELD_VALUE_STYLE = {'color': '#555', 'margin-top': '5px', 'font-size': '12px'}
+_FIELD_STYLE = {'margin-bottom': '15px'}
+_UPDATE_LIST_STYLE = {'padding-left': '20px', 'color': '#555', 'font-size': '13px'}
+_UPDATE_ITEM_STYLE = {'margin-bottom': '8px', 'line-height': '1.4'}
+
+# Outer styles of the slide-in side panels, open and closed
+def side_panel_style(z_index, right):
+    return {
+        'position': 'fixed',
+        'top': '0',
+        'right': right,
+        'z-index': z_index,
+        'transition': 'right 0.3s ease-in-out',
+        'height': '100vh'
+    }
+
+_PROJECT_PANEL_CLOSED = side_panel_style('1001', '-600px')  # Hidden off-screen
+_PROJECT_PANEL_OPEN = side_panel_style('1001', '0px')
+_ABOUT_PANEL_CLOSED = side_panel_style('1002', '-600px')
+_ABOUT_PANEL_OPEN = side_panel_style('1002', '0px')
+_UPDATES_PANEL_CLOSED = side_panel_style('1003', '-600px')
+_UPDATES_PANEL_OPEN = side_panel_style('1003', '0px')
+_ADD_PROJECT_PANEL_CLOSED = side_panel_style('1004', '-600px')
+
+# Layout styles shared by several components
+_HEADER_BUTTON_STYLE = {
+    'padding': '8px 16px',
+    'background-color': '#f8f9fa',
+    'color': '#333',
+    'border': '1px solid #ddd',
+    'border-radius': '6px',
+    'font-size': '12px',
+    'font-weight': 'bold',
+    'cursor': 'pointer',
+    'font-family': 'Arial, sans-serif',
+    'box-shadow': '0 2px 8px rgba(0,0,0,0.15)',
+    'transition': 'background-color 0.3s ease'
+}
+_SPACED_HEADER_BUTTON_STYLE = {**_HEADER_BUTTON_STYLE, 'margin-right': '8px'}
+_PRIMARY_HEADER_BUTTON_STYLE = {
+    **_HEADER_BUTTON_STYLE,
+    'background-color': '#007bff',  # Blue background
+    'color': 'white',
+    'border': '1px solid #0056b3'
+}
+_SIDEBAR_LABEL_STYLE = {
+    'font-size': '12px',
+    'font-weight': 'bold',
+    'margin-bottom': '5px',
+    'font-family': 'Arial, sans-serif',
+    'color': '#333'
+}
+_CLOSE_BUTTON_STYLE = {
+    'position': 'absolute',
+    'top': '15px',
+    'right': '15px',
+    'background': 'none',
+    'border': 'none',
+    'font-size': '20px',
+    'cursor': 'pointer',
+    'color': '#333'
+}
+_PANEL_INNER_STYLE = {
+    'width': '30vw',  # RESPONSIVE: 30% of viewport width
+    'min-width': '350px',  # Don't go smaller than 350px
+    'max-width': '600px',  # Don't go larger than 600px
+    'height': '100vh',
+    'background-color': 'rgba(255, 255, 255, 0.95)',
+    'backdrop-filter': 'blur(10px)',
+    'border-left': '1px solid rgba(0,0,0,0.1)',
+    'overflow-y': 'auto'
+}
+_PANEL_BODY_STYLE = {
+    'padding': '20px',
+    'padding-top': '50px'
+}
+
+# Material dropdown options: 'All' plus every category in the data
+_MATERIAL_OPTIONS = [{'label': 'All', 'value': 'all'}] + [
+    {'label': mat, 'value': mat} for mat in _MATERIAL_CATEGORY_NAMES
+] if not df.empty else []
 
 # Layout with RESPONSIVE SIZING and NEW UPDATES BUTTON
 app.layout = html.Div([
@@ -122,6 +427,7 @@ app.layout = html.Div([
     html.Div([
         dcc.Graph(
             id='world-map',
+            figure=go.Figure(layout=_MAP_LAYOUT),
             style={
                 'height': '100vh',
                 'width': '100vw',
@@ -159,47 +465,9 @@ app.layout = html.Div([
     
     # About Platform, Data Collection, and Add Project buttons - Top Left
     html.Div([
-        html.Button("About the Platform", id="about-platform-btn", style={
-            'padding': '8px 16px',
-            'background-color': '#f8f9fa',
-            'color': '#333',
-            'border': '1px solid #ddd',
-            'border-radius': '6px',
-            'font-size': '12px',
-            'font-weight': 'bold',
-            'cursor': 'pointer',
-            'font-family': 'Arial, sans-serif',
-            'box-shadow': '0 2px 8px rgba(0,0,0,0.15)',
-            'transition': 'background-color 0.3s ease',
-            'margin-right': '8px'
-        }),
-        html.Button("Data Collection", id="data-collection-btn", style={
-            'padding': '8px 16px',
-            'background-color': '#f8f9fa',
-            'color': '#333',
-            'border': '1px solid #ddd',
-            'border-radius': '6px',
-            'font-size': '12px',
-            'font-weight': 'bold',
-            'cursor': 'pointer',
-            'font-family': 'Arial, sans-serif',
-            'box-shadow': '0 2px 8px rgba(0,0,0,0.15)',
-            'transition': 'background-color 0.3s ease',
-            'margin-right': '8px'
-        }),
-        html.Button("Add a Project", id="add-project-btn", style={
-            'padding': '8px 16px',
-            'background-color': '#007bff',  # Blue background
-            'color': 'white',
-            'border': '1px solid #0056b3',
-            'border-radius': '6px',
-            'font-size': '12px',
-            'font-weight': 'bold',
-            'cursor': 'pointer',
-            'font-family': 'Arial, sans-serif',
-            'box-shadow': '0 2px 8px rgba(0,0,0,0.15)',
-            'transition': 'background-color 0.3s ease'
-        })
+        html.Button("About the Platform", id="about-platform-btn", style=_SPACED_HEADER_BUTTON_STYLE),
+        html.Button("Data Collection", id="data-collection-btn", style=_SPACED_HEADER_BUTTON_STYLE),
+        html.Button("Add a Project", id="add-project-btn", style=_PRIMARY_HEADER_BUTTON_STYLE)
     ], style={
         'position': 'absolute',
         'top': '10px',
@@ -211,19 +479,7 @@ app.layout = html.Div([
     
     # NEW: Updates button - Top Right
     html.Div([
-        html.Button("Updates", id="updates-btn", style={
-            'padding': '8px 16px',
-            'background-color': '#f8f9fa',
-            'color': '#333',
-            'border': '1px solid #ddd',
-            'border-radius': '6px',
-            'font-size': '12px',
-            'font-weight': 'bold',
-            'cursor': 'pointer',
-            'font-family': 'Arial, sans-serif',
-            'box-shadow': '0 2px 8px rgba(0,0,0,0.15)',
-            'transition': 'background-color 0.3s ease'
-        })
+        html.Button("Updates", id="updates-btn", style=_HEADER_BUTTON_STYLE)
     ], style={
         'position': 'absolute',
         'top': '10px',
@@ -235,18 +491,13 @@ app.layout = html.Div([
     html.Div([
         # Search Projects
         html.Div([
-            html.Label("Search Projects", style={
-                'font-size': '12px',
-                'font-weight': 'bold',
-                'margin-bottom': '5px',
-                'font-family': 'Arial, sans-serif',
-                'color': '#333'
-            }),
+            html.Label("Search Projects", style=_SIDEBAR_LABEL_STYLE),
             html.Div([
                 dcc.Input(
                     id='search-input',
                     type='text',
                     placeholder='Search projects, organizations, locations...',
+                    debounce=0.3,  # Seconds of idle typing before the dashboard refilters
                     style={
                         'width': '100%',
                         'padding': '6px 25px 6px 8px',
@@ -283,17 +534,10 @@ app.layout = html.Div([
         
         # Filter by Material
         html.Div([
-            html.Label("Filter by Material", style={
-                'font-size': '12px',
-                'font-weight': 'bold',
-                'margin-bottom': '5px',
-                'font-family': 'Arial, sans-serif',
-                'color': '#333'
-            }),
+            html.Label("Filter by Material", style=_SIDEBAR_LABEL_STYLE),
             dcc.Dropdown(
                 id='material-filter',
-                options=[{'label': 'All', 'value': 'all'}] + 
-                       [{'label': mat, 'value': mat} for mat in df['Material_Category'].unique()] if not df.empty else [],
+                options=_MATERIAL_OPTIONS,
                 value='all',
                 style={
                     'font-size': '11px', 
@@ -305,22 +549,17 @@ app.layout = html.Div([
         
         # Filter by Year
         html.Div([
-            html.Label("Filter by Year", style={
-                'font-size': '12px',
-                'font-weight': 'bold',
-                'margin-bottom': '5px',
-                'font-family': 'Arial, sans-serif',
-                'color': '#333'
-            }),
+            html.Label("Filter by Year", style=_SIDEBAR_LABEL_STYLE),
             dcc.RangeSlider(
                 id='year-filter',
-                min=int(df['Year'].min()) if not df.empty else 2015,
-                max=int(df['Year'].max()) if not df.empty else 2025,
+                min=_YEAR_MIN,
+                max=_YEAR_MAX,
                 step=1,
-                value=[int(df['Year'].min()), int(df['Year'].max())] if not df.empty else [2015, 2025],
+                updatemode='mouseup',  # Refilter once per drag, not on every tick
+                value=_FULL_YEAR_RANGE,
                 marks={
-                    int(df['Year'].min()) if not df.empty else 2015: {'label': str(int(df['Year'].min())) if not df.empty else '2015', 'style': {'font-size': '9px', 'color': '#333'}},
-                    int(df['Year'].max()) if not df.empty else 2025: {'label': str(int(df['Year'].max())) if not df.empty else '2025', 'style': {'font-size': '9px', 'color': '#333'}}
+                    _YEAR_MIN: {'label': str(_YEAR_MIN), 'style': {'font-size': '9px', 'color': '#333'}},
+                    _YEAR_MAX: {'label': str(_YEAR_MAX), 'style': {'font-size': '9px', 'color': '#333'}}
                 },
                 tooltip={"placement": "bottom", "always_visible": True}
             )
@@ -357,7 +596,7 @@ app.layout = html.Div([
                 'color': '#333',
                 'display': 'block'
             }),
-            html.P("GPT-3.5 powered assistant trained on 3D printing construction data. Ask questions or apply filters!", style={
+            html.P("GPT-4o mini powered assistant trained on 3D printing construction data. Ask questions or apply filters!", style={
                 'font-size': '9px',
                 'color': '#666',
                 'margin-bottom': '8px',
@@ -422,6 +661,7 @@ app.layout = html.Div([
     html.Div([
         dcc.Graph(
             id='timeline-chart',
+            figure=go.Figure(layout=_TIMELINE_LAYOUT),
             style={'height': '120px', 'width': '100%'},
             config={'displayModeBar': False}
         )
@@ -442,133 +682,40 @@ app.layout = html.Div([
     html.Div([
         html.Div([
             # Close button
-            html.Button("✕", id="close-panel", style={
-                'position': 'absolute',
-                'top': '15px',
-                'right': '15px',
-                'background': 'none',
-                'border': 'none',
-                'font-size': '20px',
-                'cursor': 'pointer',
-                'color': '#333'
-            }),
+            html.Button("✕", id="close-panel", style=_CLOSE_BUTTON_STYLE),
             
             # Panel content
-            html.Div(id='panel-content', style={
-                'padding': '20px',
-                'padding-top': '50px'
-            })
-        ], style={
-            'width': '30vw',  # RESPONSIVE: 30% of viewport width
-            'min-width': '350px',  # Don't go smaller than 350px
-            'max-width': '600px',  # Don't go larger than 600px
-            'height': '100vh',
-            'background-color': 'rgba(255, 255, 255, 0.95)',
-            'backdrop-filter': 'blur(10px)',
-            'border-left': '1px solid rgba(0,0,0,0.1)',
-            'overflow-y': 'auto'
-        })
-    ], id='project-panel', style={
-        'position': 'fixed',
-        'top': '0',
-        'right': '-600px',  # Hide off-screen initially
-        'z-index': '1001',
-        'transition': 'right 0.3s ease-in-out',
-        'height': '100vh'
-    }),
+            html.Div(id='panel-content', style=_PANEL_BODY_STYLE)
+        ], style=_PANEL_INNER_STYLE)
+    ], id='project-panel', style=_PROJECT_PANEL_CLOSED),
     
     # RESPONSIVE: About panel (for Data Collection & Platform info)
     html.Div([
         html.Div([
             # Close button
-            html.Button("✕", id="close-about-panel", style={
-                'position': 'absolute',
-                'top': '15px',
-                'right': '15px',
-                'background': 'none',
-                'border': 'none',
-                'font-size': '20px',
-                'cursor': 'pointer',
-                'color': '#333'
-            }),
+            html.Button("✕", id="close-about-panel", style=_CLOSE_BUTTON_STYLE),
             
             # Panel content
-            html.Div(id='about-panel-content', style={
-                'padding': '20px',
-                'padding-top': '50px'
-            })
-        ], style={
-            'width': '30vw',  # RESPONSIVE: 30% of viewport width
-            'min-width': '350px',
-            'max-width': '600px',
-            'height': '100vh',
-            'background-color': 'rgba(255, 255, 255, 0.95)',
-            'backdrop-filter': 'blur(10px)',
-            'border-left': '1px solid rgba(0,0,0,0.1)',
-            'overflow-y': 'auto'
-        })
-    ], id='about-panel', style={
-        'position': 'fixed',
-        'top': '0',
-        'right': '-600px',  # Hide off-screen initially
-        'z-index': '1002',
-        'transition': 'right 0.3s ease-in-out',
-        'height': '100vh'
-    }),
+            html.Div(id='about-panel-content', style=_PANEL_BODY_STYLE)
+        ], style=_PANEL_INNER_STYLE)
+    ], id='about-panel', style=_ABOUT_PANEL_CLOSED),
     
     # NEW: Updates panel
     html.Div([
         html.Div([
             # Close button
-            html.Button("✕", id="close-updates-panel", style={
-                'position': 'absolute',
-                'top': '15px',
-                'right': '15px',
-                'background': 'none',
-                'border': 'none',
-                'font-size': '20px',
-                'cursor': 'pointer',
-                'color': '#333'
-            }),
+            html.Button("✕", id="close-updates-panel", style=_CLOSE_BUTTON_STYLE),
             
             # Panel content
-            html.Div(id='updates-panel-content', style={
-                'padding': '20px',
-                'padding-top': '50px'
-            })
-        ], style={
-            'width': '30vw',  # RESPONSIVE: 30% of viewport width
-            'min-width': '350px',
-            'max-width': '600px',
-            'height': '100vh',
-            'background-color': 'rgba(255, 255, 255, 0.95)',
-            'backdrop-filter': 'blur(10px)',
-            'border-left': '1px solid rgba(0,0,0,0.1)',
-            'overflow-y': 'auto'
-        })
-    ], id='updates-panel', style={
-        'position': 'fixed',
-        'top': '0',
-        'right': '-600px',  # Hide off-screen initially
-        'z-index': '1003',
-        'transition': 'right 0.3s ease-in-out',
-        'height': '100vh'
-    }),
+            html.Div(id='updates-panel-content', style=_PANEL_BODY_STYLE)
+        ], style=_PANEL_INNER_STYLE)
+    ], id='updates-panel', style=_UPDATES_PANEL_CLOSED),
     
     # NEW: Add Project panel
     html.Div([
         html.Div([
             # Close button
-            html.Button("✕", id="close-add-project-panel", style={
-                'position': 'absolute',
-                'top': '15px',
-                'right': '15px',
-                'background': 'none',
-                'border': 'none',
-                'font-size': '20px',
-                'cursor': 'pointer',
-                'color': '#333'
-            }),
+            html.Button("✕", id="close-add-project-panel", style=_CLOSE_BUTTON_STYLE),
             
             # Panel content
             html.Div([
@@ -666,10 +813,7 @@ app.layout = html.Div([
                     'display': 'none'
                 })
                 
-            ], style={
-                'padding': '20px',
-                'padding-top': '50px'
-            })
+            ], style=_PANEL_BODY_STYLE)
         ], style={
             'width': '30vw',  # RESPONSIVE: 30% of viewport width
             'min-width': '400px',
@@ -680,20 +824,18 @@ app.layout = html.Div([
             'border-left': '1px solid rgba(0,0,0,0.1)',
             'overflow-y': 'auto'
         })
-    ], id='add-project-panel', style={
-        'position': 'fixed',
-        'top': '0',
-        'right': '-600px',  # Hide off-screen initially
-        'z-index': '1004',
-        'transition': 'right 0.3s ease-in-out',
-        'height': '100vh'
-    }),
+    ], id='add-project-panel', style=_ADD_PROJECT_PANEL_CLOSED),
     
     # Hidden divs for state storage
-    html.Div(id='chat-history-store', style={'display': 'none'}),
+    dcc.Store(id='chat-history-store', storage_type='memory', data=[]),
+    dcc.Store(id='chat-response-store'),  # Latest chat exchange, rendered clientside
+    dcc.Store(id='chat-stream-store'),  # Partial reply while the AI is still answering
+    dcc.Store(id='chat-log-store', storage_type='memory', data=[]),  # All exchanges shown in the chat
     html.Div(id='current-open-project', style={'display': 'none'}, children=""),
     html.Div(id='current-about-section', style={'display': 'none'}, children=""),
-    html.Div(id='selected-project-store', style={'display': 'none'}, children="")  # NEW: Track selected project for blue dots
+    html.Div(id='selected-project-store', style={'display': 'none'}, children=""),  # NEW: Track selected project for blue dots
+    dcc.Store(id='filter-index-store', data=_FILTER_INDEX),  # Per-row filter columns for the clientside filter
+    dcc.Store(id='filtered-idx')  # Row positions matching the current filters
 ], style={
     'font-family': 'Arial, sans-serif',
     'margin': '0',
@@ -712,370 +854,449 @@ def clear_search(n_clicks):
         return ""
     return dash.no_update
 
-# UPDATED: Dashboard update callback with BLUE DOT SELECTION and search functionality
-@app.callback(
-    [Output('world-map', 'figure'),
-     Output('timeline-chart', 'figure'),
-     Output('project-list', 'children'),
-     Output('selected-project-store', 'children')],
+# Filter in the browser and share the matching row positions with the callbacks below
+app.clientside_callback(
+    """
+    function(material, yearRange, search, index) {
+        var years = index.years, materials = index.materials, text = index.text;
+        var code = material === 'all' ? null : index.categories.indexOf(material);
+        if (code === -1) {
+            code = -2;  // Unknown category: matches no row
+        }
+        var term = search ? search.toLowerCase() : '';
+        var matches = [];
+        for (var i = 0; i < years.length; i++) {
+            if (years[i] >= yearRange[0] && years[i] <= yearRange[1]
+                    && (code === null || materials[i] === code)
+                    && (!term || text[i].indexOf(term) !== -1)) {
+                matches.push(i);
+            }
+        }
+        return matches;
+    }
+    """,
+    Output('filtered-idx', 'data'),
     [Input('material-filter', 'value'),
      Input('year-filter', 'value'),
-     Input('search-input', 'value'),
-     Input({'type': 'project-item', 'index': dash.dependencies.ALL, 'project_name': dash.dependencies.ALL}, 'n_clicks'),
+     Input('search-input', 'value')],
+    State('filter-index-store', 'data')
+)
+
+# Project selection from map dots, sidebar items and the panel close button
+@app.callback(
+    Output('selected-project-store', 'children'),
+    [Input({'type': 'project-item', 'index': dash.dependencies.ALL}, 'n_clicks'),
      Input('world-map', 'clickData'),
      Input('close-panel', 'n_clicks')],
     [State('selected-project-store', 'children')]
 )
-def update_dashboard_with_selection(material_filter, year_range, search_term, project_clicks, map_click_data, close_clicks, current_selected):
+def update_selected_project(project_clicks, map_click_data, close_clicks, current_selected):
     ctx = dash.callback_context
     
-    # Handle project selection
-    new_selected = current_selected or ""
+    current_selected = current_selected or ""
+    new_selected = current_selected
     
     if ctx.triggered:
-        trigger_id = ctx.triggered[0]['prop_id']
+        trigger_id = ctx.triggered_id
         trigger_value = ctx.triggered[0]['value']
         
         # Close panel = deselect
-        if 'close-panel' in trigger_id:
+        if trigger_id == 'close-panel':
             new_selected = ""
         
-        # Map dot clicked
-        elif 'world-map.clickData' in trigger_id and map_click_data:
+        # Map dot clicked - customdata carries the row position, not the name
+        elif trigger_id == 'world-map' and map_click_data:
             try:
-                clicked_project = map_click_data['points'][0]['customdata']
+                clicked_project = df['Project'].iat[int(map_click_data['points'][0]['customdata'])]
                 new_selected = clicked_project if clicked_project != current_selected else ""
-            except (KeyError, IndexError, TypeError):
+            except (KeyError, IndexError, TypeError, ValueError):
                 pass
         
-        # Sidebar project clicked - FIXED LOGIC
-        elif 'project-item' in trigger_id:
-            try:
-                # Extract project name from the trigger ID
-                import json
-                trigger_dict = json.loads(trigger_id.split('.')[0])
-                clicked_project = trigger_dict['project_name']
-                # Toggle selection: if same project clicked, deselect; otherwise select
-                new_selected = clicked_project if clicked_project != current_selected else ""
-            except (json.JSONDecodeError, KeyError):
-                # Fallback method
-                if '"project_name":"' in trigger_id:
-                    start = trigger_id.find('"project_name":"') + len('"project_name":"')
-                    end = trigger_id.find('"', start)
-                    clicked_project = trigger_id[start:end]
-                    new_selected = clicked_project if clicked_project != current_selected else ""
+        # Sidebar project clicked (re-rendered items arrive with n_clicks=0); the id carries the row position
+        elif isinstance(trigger_id, dict) and trigger_id.get('type') == 'project-item' and trigger_value:
+            clicked_project = df['Project'].iat[trigger_id['index']]
+            # Toggle selection: if same project clicked, deselect; otherwise select
+            new_selected = clicked_project if clicked_project != current_selected else ""
     
+    # Leave the selection store untouched unless it changed
+    if new_selected == current_selected:
+        return dash.no_update
+    return new_selected
+
+# Plain Scattergeo marker trace dict for a set of row positions (customdata = row position)
+def project_markers(idx, marker, name):
+    return dict(
+        type='scattergeo',
+        lon=_LONGITUDES[idx],
+        lat=_LATITUDES[idx],
+        mode='markers',
+        marker=marker,
+        text=_HOVER_TEXT[idx],
+        hovertemplate='%{text}<extra></extra>',
+        showlegend=False,
+        customdata=idx.astype(np.int32),
+        name=name
+    )
+
+# Base map trace per filtered row set
+@functools.lru_cache(maxsize=32)
+def base_map_trace(filtered_idx):
+    return project_markers(np.array(filtered_idx, dtype=np.intp), _PROJECT_MARKER, 'projects')
+
+# Map markers with BLUE DOT SELECTION
+@app.callback(
+    Output('world-map', 'figure'),
+    [Input('filtered-idx', 'data'),
+     Input('selected-project-store', 'children')]
+)
+def update_map(filtered_idx, selected_project):
+    # Only the trace data goes over the wire; the geo layout stays client-side
+    map_fig = dash.Patch()
     if df.empty:
-        return {}, {}, "No data available", new_selected
-    
-    # Filter data by year and material
-    filtered_df = df.loc[
-        (df['Year'] >= year_range[0]) & 
-        (df['Year'] <= year_range[1])
-    ].copy()
+        map_fig['data'] = []
+        return map_fig
     
-    if material_filter != 'all':
-        filtered_df = filtered_df.loc[filtered_df['Material_Category'] == material_filter].copy()
+    filtered_idx = tuple(filtered_idx or ())
     
-    # Apply search filter if search term exists
-    if search_term:
-        search_term = search_term.lower()
-        search_mask = (
-            filtered_df['Project'].str.lower().str.contains(search_term, na=False) |
-            filtered_df['Organization'].str.lower().str.contains(search_term, na=False) |
-            filtered_df['Country'].str.lower().str.contains(search_term, na=False) |
-            filtered_df['City'].str.lower().str.contains(search_term, na=False) |
-            filtered_df['Material'].str.lower().str.contains(search_term, na=False)
-        )
-        filtered_df = filtered_df.loc[search_mask].copy()
+    # BLUE DOT LOGIC: trace 0 is every filtered project, trace 1 the selected one
+    selected_idx = np.array(filtered_idx, dtype=np.intp)
+    selected_idx = selected_idx[_PROJECT_NAMES[selected_idx] == selected_project] if selected_project else selected_idx[:0]
+    selected_trace = project_markers(selected_idx, _SELECTED_PROJECT_MARKER, 'selected_project')
     
-    # BLUE DOT LOGIC: Create color array and size array based on selection
-    if len(filtered_df) > 0 and 'Latitude' in filtered_df.columns:
-        # Create colors array - blue for selected, black for others
-        colors = ['blue' if project == new_selected else 'black' 
-                 for project in filtered_df['Project'].values]
-        
-        # Create sizes array - 10% larger for selected, normal for others
-        sizes = [11 if project == new_selected else 10 
-                for project in filtered_df['Project'].values]
-        
-        map_fig = go.Figure()
-        
-        tooltip_text = (filtered_df['Project'] + '<br>' + 
-                       filtered_df['Organization'] + '<br>' +
-                       filtered_df['City'] + ', ' + filtered_df['Country'] + '<br>' +
-                       'Material: ' + filtered_df['Material_Category'] + '<br>' +
-                       'Year: ' + filtered_df['Year'].astype(int).astype(str))
-        
-        # Add non-selected dots first (so selected appears on top)
-        non_selected_mask = filtered_df['Project'] != new_selected
-        if non_selected_mask.any():
-            map_fig.add_trace(go.Scattergeo(
-                lon=filtered_df.loc[non_selected_mask, 'Longitude'],
-                lat=filtered_df.loc[non_selected_mask, 'Latitude'],
-                mode='markers',
-                marker=dict(
-                    size=10,
-                    color='black',
-                    opacity=0.8,
-                    line=dict(width=1, color='white')
-                ),
-                text=tooltip_text[non_selected_mask],
-                hovertemplate='%{text}<extra></extra>',
-                showlegend=False,
-                customdata=filtered_df.loc[non_selected_mask, 'Project'].values,
-                name='projects'
-            ))
-        
-        # Add selected dot last (appears on top)
-        selected_mask = filtered_df['Project'] == new_selected
-        if selected_mask.any() and new_selected:
-            map_fig.add_trace(go.Scattergeo(
-                lon=filtered_df.loc[selected_mask, 'Longitude'],
-                lat=filtered_df.loc[selected_mask, 'Latitude'],
-                mode='markers',
-                marker=dict(
-                    size=15,  # 10% larger
-                    color='blue',
-                    opacity=0.9,  # Slightly more opaque
-                    line=dict(width=2, color='white')  # Thicker border
-                ),
-                text=tooltip_text[selected_mask],
-                hovertemplate='%{text}<extra></extra>',
-                showlegend=False,
-                customdata=filtered_df.loc[selected_mask, 'Project'].values,
-                name='selected_project'
-            ))
-        
-        map_fig.update_layout(
-            geo=dict(
-                projection_type='natural earth',
-                showland=True,
-                landcolor='rgb(245,245,245)',
-                showocean=True,
-                oceancolor='rgb(255,255,255)',
-                showlakes=True,
-                lakecolor='rgb(255,255,255)',
-                showrivers=False,
-                showcountries=True,
-                countrycolor='rgb(220,220,220)',
-                coastlinecolor='rgb(220,220,220)',
-                showframe=False,
-                showcoastlines=True
-            ),
-            margin=dict(l=0, r=0, t=0, b=0),
-            height=None,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
+    # A selection change only patches the overlay trace
+    if list(dash.ctx.triggered_prop_ids) == ['selected-project-store.children']:
+        map_fig['data'][1] = selected_trace
     else:
-        map_fig = go.Figure()
-        map_fig.update_layout(
-            height=None,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            margin=dict(l=0, r=0, t=0, b=0)
-        )
+        map_fig['data'] = [base_map_trace(filtered_idx), selected_trace]
     
-    # Timeline chart
-    if len(filtered_df) > 0:
-        timeline_data = filtered_df.groupby('Year').size().reset_index(name='Count')
-        timeline_fig = go.Figure()
-        timeline_fig.add_trace(go.Scatter(
-            x=timeline_data['Year'],
-            y=timeline_data['Count'],
-            mode='lines+markers',
-            line=dict(color='black', width=2),
-            marker=dict(color='black', size=4),
-            showlegend=False
-        ))
-        timeline_fig.update_layout(
-            margin=dict(l=5, r=10, t=5, b=20),
-            height=120,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(
-                showgrid=False,
-                showline=False,
-                title='',
-                tickfont=dict(size=7, color='#333'),
-                color='#333'
-            ),
-            yaxis=dict(
-                showgrid=False,
-                showticklabels=False,
-                showline=False,
-                title='',
-                visible=False
-            )
-        )
-    else:
-        timeline_fig = go.Figure()
-        timeline_fig.update_layout(
-            height=120,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            margin=dict(l=0, r=0, t=5, b=20)
-        )
+    return map_fig
+
+# Projects-per-year trace for a set of rows, cached like the map's base trace
+@functools.lru_cache(maxsize=32)
+def timeline_traces(filtered_idx):
+    if not filtered_idx:
+        return []
+    
+    # Projects per year via a bincount over the (small, bounded) year range
+    year_counts = np.bincount(_YEAR_VALUES[list(filtered_idx)].astype(np.int32) - _YEAR_MIN)
+    has_projects = year_counts > 0
+    timeline_years = np.arange(_YEAR_MIN, _YEAR_MIN + len(year_counts))[has_projects]
+    timeline_counts = year_counts[has_projects]
+    return [dict(
+        type='scatter',
+        x=timeline_years,
+        y=timeline_counts,
+        mode='lines+markers',
+        line=_TIMELINE_LINE,
+        marker=_TIMELINE_MARKER,
+        showlegend=False
+    )]
+
+# Projects-per-year timeline
+@app.callback(
+    Output('timeline-chart', 'figure'),
+    Input('filtered-idx', 'data')
+)
+def update_timeline(filtered_idx):
+    # As with the map, the timeline layout is static and only its data is patched
+    timeline_fig = dash.Patch()
+    timeline_fig['data'] = timeline_traces(tuple(filtered_idx or ()))
+    
+    return timeline_fig
+
+# Project list with SELECTION HIGHLIGHTING
+@app.callback(
+    Output('project-list', 'children'),
+    [Input('filtered-idx', 'data'),
+     Input('selected-project-store', 'children')]
+)
+def update_project_list(filtered_idx, selected_project):
+    if df.empty:
+        return "No data available"
     
-    # Project list with SELECTION HIGHLIGHTING
-    if len(filtered_df) > 0:
+    filtered_idx = filtered_idx or []
+    
+    if len(filtered_idx) > 0:
         project_items = []
-        for idx, row in filtered_df.iterrows():
+        # Only the first rows are taken out of df and rendered
+        list_df = df.iloc[filtered_idx[:_MAX_PROJECT_LIST_ITEMS]]
+        rows = zip(
+            list_df.index.to_numpy(),
+            list_df['Project'].to_numpy(),
+            list_df['Organization'].to_numpy(),
+            list_df['Year'].to_numpy(np.int32),
+            list_df['City'].to_numpy(),
+            list_df['Country'].to_numpy()
+        )
+        for idx, project, organization, year, city, country in rows:
+            idx = int(idx)
             # Highlight selected project in sidebar
-            is_selected = row['Project'] == new_selected
-            bg_color = 'rgba(0, 102, 204, 0.1)' if is_selected else 'transparent'
+            is_selected = project == selected_project
             
             project_items.append(
                 html.Div([
                     html.Div(
-                        row['Project'], 
+                        project, 
                         id=f'project-link-{idx}',
-                        style={
-                            'font-weight': 'bold',
-                            'color': '#0066cc',
-                            'cursor': 'pointer',
-                            'margin-bottom': '2px'
-                        },
+                        style=_LIST_ITEM_LINK_STYLE,
                         className='project-link',
                         **{'data-project-index': idx}
                     ),
-                    html.Div(f"{row['Organization']}", style={
-                        'color': '#666',
-                        'font-size': '9px'
-                    }),
-                    html.Div(f"{row['Year']} • {row['City']}, {row['Country']}", style={
-                        'color': '#888',
-                        'font-size': '8px'
-                    })
-                ], style={
-                    'padding': '6px 8px',
-                    'margin-bottom': '2px',
-                    'border-radius': '3px',
-                    'cursor': 'pointer',
-                    'transition': 'background-color 0.2s',
-                    'background-color': bg_color  # HIGHLIGHT SELECTED PROJECT
-                }, 
+                    html.Div(f"{organization}", style=_LIST_ITEM_ORG_STYLE),
+                    html.Div(f"{year} • {city}, {country}", style=_LIST_ITEM_META_STYLE)
+                ], style=_SELECTED_LIST_ITEM_STYLE if is_selected else _LIST_ITEM_STYLE,
                 className='project-item',
-                id={'type': 'project-item', 'index': idx, 'project_name': row['Project']},
+                id={'type': 'project-item', 'index': idx},
                 n_clicks=0
                 )
             )
+        if len(filtered_idx) > _MAX_PROJECT_LIST_ITEMS:
+            project_items.append(html.Div(
+                f"Showing {_MAX_PROJECT_LIST_ITEMS} of {len(filtered_idx)} projects - refine the filters to see more",
+                style={'color': '#888', 'font-style': 'italic', 'font-size': '9px', 'padding': '6px 8px'}
+            ))
         project_list = project_items
     else:
         project_list = [html.Div("No projects match the current filters", style={'color': '#888', 'font-style': 'italic'})]
     
-    return map_fig, timeline_fig, project_list, new_selected
+    return project_list
+
+# Panel error content: the heading is shared, only the message is built per error
+_ERROR_TITLE = html.H4("Error Loading Project", style={'color': '#d32f2f'})
+_ERROR_TEXT_STYLE = {'color': '#666'}
+
+def error_panel_content(message):
+    return html.Div([_ERROR_TITLE, html.P(message, style=_ERROR_TEXT_STYLE)])
 
-# Project panel callback - simplified since selection is handled above
+# Project panel content for one row of df
+def project_panel_content(project_data):
+    return html.Div([
+        html.H3(project_data['Project'], style={
+            'color': '#333',
+            'margin-bottom': '20px',
+            'font-size': '20px',
+            'font-weight': 'bold',
+            'line-height': '1.3'
+        }),
+        
+        html.Div([
+            html.Strong("Description:", style={'color': '#333', 'font-size': '14px'}),
+            html.P(
+                project_data.get('Descrtiption', project_data.get('Description', 'No description available')), 
+                style={
+                    'color': '#555', 
+                    'margin-top': '8px', 
+                    'line-height': '1.5',
+                    'font-size': '13px'
+                }
+            )
+        ], style={'margin-bottom': '25px'}),
+        
+        html.Div([
+            html.Div([
+                html.Strong("Organization:", style=_FIELD_LABEL_STYLE),
+                html.P(project_data['Organization'], style=_FIELD_VALUE_STYLE)
+            ], style=_FIELD_STYLE),
+            
+            html.Div([
+                html.Strong("Year:", style=_FIELD_LABEL_STYLE),
+                html.P(str(int(project_data['Year'])), style=_FIELD_VALUE_STYLE)
+            ], style=_FIELD_STYLE),
+            
+            html.Div([
+                html.Strong("Location:", style=_FIELD_LABEL_STYLE),
+                html.P(f"{project_data['City']}, {project_data['Country']}", 
+                       style=_FIELD_VALUE_STYLE)
+            ], style=_FIELD_STYLE),
+            
+            html.Div([
+                html.Strong("Material:", style=_FIELD_LABEL_STYLE),
+                html.P(project_data['Material'], style=_FIELD_VALUE_STYLE)
+            ], style={'margin-bottom': '25px'}),
+            
+            html.Div([
+                html.Strong("Project Website:", style=_FIELD_LABEL_STYLE),
+                html.Br(),
+                html.A("🔗 Visit Project Page", 
+                       href=project_data.get('Link', '#'),
+                       target="_blank",
+                       style={
+                           'color': '#0066cc', 
+                           'text-decoration': 'none', 
+                           'margin-top': '8px', 
+                           'display': 'inline-block',
+                           'font-size': '12px',
+                           'padding': '8px 12px',
+                           'border': '1px solid #0066cc',
+                           'border-radius': '4px',
+                           'background-color': '#f8f9fa'
+                       })
+                if project_data.get('Link') else html.P("No website available", style={'color': '#999', 'margin-top': '8px', 'font-style': 'italic', 'font-size': '12px'})
+            ])
+        ])
+    ])
+
+# Serialized panel tree per row position
+@functools.lru_cache(maxsize=256)
+def project_panel_tree(project_idx):
+    return to_plain_tree(project_panel_content(df.iloc[project_idx]))
+
+# Project panel slide in/out runs clientside, while its content is fetched
+app.clientside_callback(
+    """
+    function(selectedProject, closeClicks) {
+        var triggered = window.dash_clientside.callback_context.triggered;
+        var closing = triggered.length && triggered[0].prop_id === 'close-panel.n_clicks';
+        return selectedProject && !closing ? %(open)s : %(closed)s;
+    }
+    """ % {'open': json.dumps(_PROJECT_PANEL_OPEN), 'closed': json.dumps(_PROJECT_PANEL_CLOSED)},
+    Output('project-panel', 'style'),
+    [Input('selected-project-store', 'children'),
+     Input('close-panel', 'n_clicks')]
+)
+
+# Project panel content - only built (or taken from the cache) on the server
 @app.callback(
-    [Output('project-panel', 'style'),
-     Output('panel-content', 'children'),
+    [Output('panel-content', 'children'),
      Output('current-open-project', 'children')],
     [Input('selected-project-store', 'children'),
      Input('close-panel', 'n_clicks')],
-    [State('project-panel', 'style'),
-     State('current-open-project', 'children')]
+    [State('current-open-project', 'children')]
 )
-def toggle_project_panel(selected_project, close_clicks, current_style, current_open_project):
+def toggle_project_panel(selected_project, close_clicks, current_open_project):
     ctx = dash.callback_context
     
     if not ctx.triggered:
-        return current_style, "", ""
+        return "", ""
     
-    trigger_id = ctx.triggered[0]['prop_id']
+    trigger_id = ctx.triggered_id
     
     # Close panel button clicked
-    if 'close-panel' in trigger_id:
-        return {**current_style, 'right': '-600px'}, "", ""
+    if trigger_id == 'close-panel':
+        return "", ""
     
     # Project selected/changed
     if selected_project and selected_project != current_open_project and not df.empty:
+        project_idx = _PROJECT_TO_IDX.get(selected_project)
+        if project_idx is None:
+            return dash.no_update, dash.no_update
         try:
-            # Find project by name
-            project_data = df[df['Project'] == selected_project].iloc[0]
+            panel_content = project_panel_tree(project_idx)
             
-            # Create panel content
-            panel_content = html.Div([
-                html.H3(project_data['Project'], style={
-                    'color': '#333',
-                    'margin-bottom': '20px',
-                    'font-size': '20px',
-                    'font-weight': 'bold',
-                    'line-height': '1.3'
-                }),
-                
-                html.Div([
-                    html.Strong("Description:", style={'color': '#333', 'font-size': '14px'}),
-                    html.P(
-                        project_data.get('Descrtiption', project_data.get('Description', 'No description available')), 
-                        style={
-                            'color': '#555', 
-                            'margin-top': '8px', 
-                            'line-height': '1.5',
-                            'font-size': '13px'
-                        }
-                    )
-                ], style={'margin-bottom': '25px'}),
-                
-                html.Div([
-                    html.Div([
-                        html.Strong("Organization:", style={'color': '#333', 'font-size': '12px'}),
-                        html.P(project_data['Organization'], style={'color': '#555', 'margin-top': '5px', 'font-size': '12px'})
-                    ], style={'margin-bottom': '15px'}),
-                    
-                    html.Div([
-                        html.Strong("Year:", style={'color': '#333', 'font-size': '12px'}),
-                        html.P(str(int(project_data['Year'])), style={'color': '#555', 'margin-top': '5px', 'font-size': '12px'})
-                    ], style={'margin-bottom': '15px'}),
-                    
-                    html.Div([
-                        html.Strong("Location:", style={'color': '#333', 'font-size': '12px'}),
-                        html.P(f"{project_data['City']}, {project_data['Country']}", 
-                               style={'color': '#555', 'margin-top': '5px', 'font-size': '12px'})
-                    ], style={'margin-bottom': '15px'}),
-                    
-                    html.Div([
-                        html.Strong("Material:", style={'color': '#333', 'font-size': '12px'}),
-                        html.P(project_data['Material'], style={'color': '#555', 'margin-top': '5px', 'font-size': '12px'})
-                    ], style={'margin-bottom': '25px'}),
-                    
-                    html.Div([
-                        html.Strong("Project Website:", style={'color': '#333', 'font-size': '12px'}),
-                        html.Br(),
-                        html.A("🔗 Visit Project Page", 
-                               href=project_data.get('Link', '#'),
-                               target="_blank",
-                               style={
-                                   'color': '#0066cc', 
-                                   'text-decoration': 'none', 
-                                   'margin-top': '8px', 
-                                   'display': 'inline-block',
-                                   'font-size': '12px',
-                                   'padding': '8px 12px',
-                                   'border': '1px solid #0066cc',
-                                   'border-radius': '4px',
-                                   'background-color': '#f8f9fa'
-                               })
-                        if project_data.get('Link') else html.P("No website available", style={'color': '#999', 'margin-top': '8px', 'font-style': 'italic', 'font-size': '12px'})
-                    ])
-                ])
-            ])
-            
-            return {**current_style, 'right': '0px'}, panel_content, selected_project
+            return panel_content, selected_project
             
         except Exception as e:
-            error_content = html.Div([
-                html.H4("Error Loading Project", style={'color': '#d32f2f'}),
-                html.P(f"Unable to load project details: {str(e)}", style={'color': '#666'})
-            ])
-            return {**current_style, 'right': '0px'}, error_content, selected_project
+            return error_panel_content(f"Unable to load project details: {str(e)[:200]}"), selected_project
     
-    # No project selected - close panel
+    # No project selected - clear the panel
     elif not selected_project:
-        return {**current_style, 'right': '-600px'}, "", ""
+        return "", ""
     
-    return current_style, "", current_open_project
+    return dash.no_update, dash.no_update
+
+# Serialize a component tree into plain dicts
+def to_plain_tree(component):
+    return json.loads(to_json_plotly(component))
+
+# Static About Platform / Data Collection panel content, built once at import
+_ABOUT_PLATFORM_CONTENT = to_plain_tree(html.Div([
+    html.H2("Building the Platform", style=_PANEL_TITLE_STYLE),
+    html.H3("How The 3D Printing Construction Dashboard Is Built", style=_PANEL_SUBTITLE_STYLE),
+
+    html.P("Note: This is a passion project that continuously tracks additive manufacturing in construction. While it aims to provide valuable insights into industry trends, it should not be used as a sole source of data or for critical decision-making.", style={
+        'margin-bottom': '20px',
+        'line-height': '1.6',
+        'font-size': '13px',
+        'color': '#666',
+        'font-style': 'italic',
+        'padding': '10px',
+        'background-color': '#f8f9fa',
+        'border-radius': '5px'
+    }),
+
+    html.P("This platform transforms raw construction project data into actionable insights through a technical architecture built entirely using Python (with loads of help from Claude) without any visual UI. This approach was chosen to avoid paid platforms while maintaining professional functionality. Here's how it works:", style={
+        'margin-bottom': '20px',
+        'line-height': '1.6',
+        'font-size': '14px'
+    }),
+
+    html.Div([
+        html.H4("Frontend Framework:", style=_SECTION_HEADING_STYLE),
+        html.P("Built on Plotly Dash with a full-window world map, floating control panels, and real-time data visualization that updates as users apply filters by materials, years, and regions.", style=_SECTION_TEXT_STYLE)
+    ]),
+
+    html.Div([
+        html.H4("Data Visualization:", style=_SECTION_HEADING_STYLE),
+        html.P("Project coordinates become interactive map markers, with timeline charts showing industry patterns over time. Users can filter data and see results instantly across all visualizations.", style=_SECTION_TEXT_STYLE)
+    ]),
+
+    html.Div([
+        html.H4("AI Assistant:", style=_SECTION_HEADING_STYLE),
+        html.P("A GPT-4o mini chatbot understands commands like \"show concrete projects from 2020-2023\" and applies the appropriate filters. It maintains awareness of what data is currently being viewed.", style=_SECTION_TEXT_STYLE)
+    ]),
+
+    html.Div([
+        html.H4("Technical Implementation:", style=_SECTION_HEADING_STYLE),
+        html.P("Python handles data processing with pandas, manages user interactions through Dash callbacks, and maintains chat history and panel states.", style=_SECTION_TEXT_STYLE)
+    ])
+]))
+
+_DATA_COLLECTION_CONTENT = to_plain_tree(html.Div([
+    html.H2("Data Collection", style=_PANEL_TITLE_STYLE),
+    html.H3("How 3D Printing Construction Projects Are Collected", style=_PANEL_SUBTITLE_STYLE),
+
+    html.P("Note: This is a passion project that continuously tracks additive manufacturing in construction. While it aims to provide valuable insights into industry trends, it should not be used as a sole source of data or for critical decision-making.", style={
+        'margin-bottom': '20px',
+        'line-height': '1.6',
+        'font-size': '13px',
+        'color': '#666',
+        'font-style': 'italic',
+        'padding': '10px',
+        'background-color': '#f8f9fa',
+        'border-radius': '5px'
+    }),
+
+    html.P("This database tracks 3D printing construction projects from around the world. Here's how it works:", style={
+        'margin-bottom': '20px',
+        'line-height': '1.6',
+        'font-size': '14px'
+    }),
+
+    html.Div([
+        html.H4("Source Data:", style=_SECTION_HEADING_STYLE),
+        html.P("Projects are initially added from URLs sourced from a manually curated database that was previously assembled, largely based on RSS feeds. This existing collection serves as the foundation for automated processing and analysis.", style=_SECTION_TEXT_STYLE)
+    ]),
+
+    html.Div([
+        html.H4("Automated Data Extraction:", style=_SECTION_HEADING_STYLE),
+        html.P("A Python-based system automatically visits each URL and extracts key information: project names, completion years, materials used, locations, and the organizations behind them, rather than requiring manual data entry for each project. This process is designed with respect for website policies, using reasonable delays between requests, honoring robots.txt files, and focusing only on publicly available information about projects, largely based on RSS feeds.", style=_SECTION_TEXT_STYLE)
+    ]),
+
+    html.Div([
+        html.H4("AI-Powered Understanding:", style=_SECTION_HEADING_STYLE),
+        html.P("The system uses OpenAI's technology to \"read\" a snippet of each project webpage (to reduce costs and token usage), interpreting details like whether a project used concrete or metal, if it was built by a university or company, and where in the world it's located.", style=_SECTION_TEXT_STYLE)
+    ]),
+
+    html.Div([
+        html.H4("Pattern Recognition & Key Player Identification:", style=_SECTION_HEADING_STYLE),
+        html.P("As the system processes projects, it builds patterns to identify key players in the industry, tracks organizational preferences (like which materials different companies typically use), and maps emerging trends in 3D printing construction.", style=_SECTION_TEXT_STYLE)
+    ]),
+
+    html.Div([
+        html.H4("Intelligent Project Discovery:", style=_SECTION_HEADING_STYLE),
+        html.P("Using keywords and patterns learned from the existing database, the system monitors RSS feeds from construction industry publications, research institutions, and key organizations to automatically discover new relevant projects. This discovery process is largely based on RSS feeds, ensuring access to legitimately syndicated content. When potential projects are found but the system is unsure about their relevance, they are flagged for manual review.", style=_SECTION_TEXT_STYLE)
+    ]),
+
+    html.Div([
+        html.H4("AI as a tool:", style=_SECTION_HEADING_STYLE),
+        html.P("This hybrid approach tries to ensure comprehensive coverage while maintaining accuracy - automation handles clear matches while human oversight validates uncertain cases.", style=_SECTION_TEXT_STYLE)
+    ]),
+
+    html.Div([
+        html.H4("Result:", style=_SECTION_HEADING_STYLE),
+        html.P("A continuously-updating view of how 3D printing is transforming the construction industry, revealing key players, material trends, and geographic hotspots worldwide. Obviously, all results should be taken with a pinch of (printed) salt.", style=_SECTION_TEXT_STYLE)
+    ])
+]))
 
 # About panel callback
 @app.callback(
@@ -1085,159 +1306,37 @@ def toggle_project_panel(selected_project, close_clicks, current_style, current_
     [Input('about-platform-btn', 'n_clicks'),
      Input('data-collection-btn', 'n_clicks'),
      Input('close-about-panel', 'n_clicks')],
-    [State('about-panel', 'style'),
-     State('current-about-section', 'children')]
+    [State('current-about-section', 'children')]
 )
-def toggle_about_panel(platform_clicks, data_clicks, close_clicks, current_style, current_section):
+def toggle_about_panel(platform_clicks, data_clicks, close_clicks, current_section):
     ctx = dash.callback_context
     
     if not ctx.triggered:
-        return current_style, "", ""
+        return _ABOUT_PANEL_CLOSED, "", ""
     
-    trigger_id = ctx.triggered[0]['prop_id']
+    trigger_id = ctx.triggered_id
     
     # Close panel button clicked
-    if 'close-about-panel' in trigger_id:
-        return {**current_style, 'right': '-600px'}, "", ""
+    if trigger_id == 'close-about-panel':
+        return _ABOUT_PANEL_CLOSED, "", ""
     
     # About Platform button clicked
-    if 'about-platform-btn' in trigger_id and platform_clicks:
+    if trigger_id == 'about-platform-btn' and platform_clicks:
         # Toggle: if same section is open, close it
         if current_section == "about-platform":
-            return {**current_style, 'right': '-600px'}, "", ""
-        
-        # Create About Platform content
-        content = html.Div([
-            html.H2("Building the Platform", style={
-                'color': '#333',
-                'margin-bottom': '20px',
-                'font-size': '24px',
-                'font-weight': 'bold'
-            }),
-            html.H3("How The 3D Printing Construction Dashboard Is Built", style={
-                'color': '#555',
-                'margin-bottom': '20px',
-                'font-size': '18px',
-                'font-weight': 'normal'
-            }),
-            
-            html.P("Note: This is a passion project that continuously tracks additive manufacturing in construction. While it aims to provide valuable insights into industry trends, it should not be used as a sole source of data or for critical decision-making.", style={
-                'margin-bottom': '20px',
-                'line-height': '1.6',
-                'font-size': '13px',
-                'color': '#666',
-                'font-style': 'italic',
-                'padding': '10px',
-                'background-color': '#f8f9fa',
-                'border-radius': '5px'
-            }),
-            
-            html.P("This platform transforms raw construction project data into actionable insights through a technical architecture built entirely using Python (with loads of help from Claude) without any visual UI. This approach was chosen to avoid paid platforms while maintaining professional functionality. Here's how it works:", style={
-                'margin-bottom': '20px',
-                'line-height': '1.6',
-                'font-size': '14px'
-            }),
-            
-            html.Div([
-                html.H4("Frontend Framework:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("Built on Plotly Dash with a full-window world map, floating control panels, and real-time data visualization that updates as users apply filters by materials, years, and regions.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ]),
-            
-            html.Div([
-                html.H4("Data Visualization:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("Project coordinates become interactive map markers, with timeline charts showing industry patterns over time. Users can filter data and see results instantly across all visualizations.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ]),
-            
-            html.Div([
-                html.H4("AI Assistant:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("A GPT-3.5-turbo chatbot understands commands like \"show concrete projects from 2020-2023\" and applies the appropriate filters. It maintains awareness of what data is currently being viewed.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ]),
-            
-            html.Div([
-                html.H4("Technical Implementation:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("Python handles data processing with pandas, manages user interactions through Dash callbacks, and maintains chat history and panel states.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ])
-        ])
+            return _ABOUT_PANEL_CLOSED, "", ""
         
-        return {**current_style, 'right': '0px'}, content, "about-platform"
+        return _ABOUT_PANEL_OPEN, _ABOUT_PLATFORM_CONTENT, "about-platform"
     
     # Data Collection button clicked
-    if 'data-collection-btn' in trigger_id and data_clicks:
+    if trigger_id == 'data-collection-btn' and data_clicks:
         # Toggle: if same section is open, close it
         if current_section == "data-collection":
-            return {**current_style, 'right': '-600px'}, "", ""
+            return _ABOUT_PANEL_CLOSED, "", ""
         
-        # Create Data Collection content
-        content = html.Div([
-            html.H2("Data Collection", style={
-                'color': '#333',
-                'margin-bottom': '20px',
-                'font-size': '24px',
-                'font-weight': 'bold'
-            }),
-            html.H3("How 3D Printing Construction Projects Are Collected", style={
-                'color': '#555',
-                'margin-bottom': '20px',
-                'font-size': '18px',
-                'font-weight': 'normal'
-            }),
-            
-            html.P("Note: This is a passion project that continuously tracks additive manufacturing in construction. While it aims to provide valuable insights into industry trends, it should not be used as a sole source of data or for critical decision-making.", style={
-                'margin-bottom': '20px',
-                'line-height': '1.6',
-                'font-size': '13px',
-                'color': '#666',
-                'font-style': 'italic',
-                'padding': '10px',
-                'background-color': '#f8f9fa',
-                'border-radius': '5px'
-            }),
-            
-            html.P("This database tracks 3D printing construction projects from around the world. Here's how it works:", style={
-                'margin-bottom': '20px',
-                'line-height': '1.6',
-                'font-size': '14px'
-            }),
-            
-            html.Div([
-                html.H4("Source Data:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("Projects are initially added from URLs sourced from a manually curated database that was previously assembled, largely based on RSS feeds. This existing collection serves as the foundation for automated processing and analysis.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ]),
-            
-            html.Div([
-                html.H4("Automated Data Extraction:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("A Python-based system automatically visits each URL and extracts key information: project names, completion years, materials used, locations, and the organizations behind them, rather than requiring manual data entry for each project. This process is designed with respect for website policies, using reasonable delays between requests, honoring robots.txt files, and focusing only on publicly available information about projects, largely based on RSS feeds.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ]),
-            
-            html.Div([
-                html.H4("AI-Powered Understanding:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("The system uses OpenAI's technology to \"read\" a snippet of each project webpage (to reduce costs and token usage), interpreting details like whether a project used concrete or metal, if it was built by a university or company, and where in the world it's located.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ]),
-            
-            html.Div([
-                html.H4("Pattern Recognition & Key Player Identification:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("As the system processes projects, it builds patterns to identify key players in the industry, tracks organizational preferences (like which materials different companies typically use), and maps emerging trends in 3D printing construction.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ]),
-            
-            html.Div([
-                html.H4("Intelligent Project Discovery:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("Using keywords and patterns learned from the existing database, the system monitors RSS feeds from construction industry publications, research institutions, and key organizations to automatically discover new relevant projects. This discovery process is largely based on RSS feeds, ensuring access to legitimately syndicated content. When potential projects are found but the system is unsure about their relevance, they are flagged for manual review.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ]),
-            
-            html.Div([
-                html.H4("AI as a tool:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("This hybrid approach tries to ensure comprehensive coverage while maintaining accuracy - automation handles clear matches while human oversight validates uncertain cases.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ]),
-            
-            html.Div([
-                html.H4("Result:", style={'color': '#333', 'font-size': '14px', 'margin-bottom': '8px'}),
-                html.P("A continuously-updating view of how 3D printing is transforming the construction industry, revealing key players, material trends, and geographic hotspots worldwide. Obviously, all results should be taken with a pinch of (printed) salt.", style={'margin-bottom': '15px', 'line-height': '1.5', 'font-size': '13px'})
-            ])
-        ])
-        
-        return {**current_style, 'right': '0px'}, content, "data-collection"
+        return _ABOUT_PANEL_OPEN, _DATA_COLLECTION_CONTENT, "data-collection"
     
-    return current_style, "", current_section
+    return dash.no_update, dash.no_update, dash.no_update
 
 # NEW: Updates panel callback
 @app.callback(
@@ -1251,19 +1350,19 @@ def toggle_updates_panel(updates_clicks, close_clicks, current_style):
     ctx = dash.callback_context
     
     if not ctx.triggered:
-        return current_style, ""
+        return dash.no_update, dash.no_update
     
-    trigger_id = ctx.triggered[0]['prop_id']
+    trigger_id = ctx.triggered_id
     
     # Close panel button clicked
-    if 'close-updates-panel' in trigger_id:
-        return {**current_style, 'right': '-600px'}, ""
+    if trigger_id == 'close-updates-panel':
+        return _UPDATES_PANEL_CLOSED, ""
     
     # Updates button clicked
-    if 'updates-btn' in trigger_id and updates_clicks:
+    if trigger_id == 'updates-btn' and updates_clicks:
         # Toggle panel
         if current_style.get('right', '-600px') == '0px':
-            return {**current_style, 'right': '-600px'}, ""
+            return _UPDATES_PANEL_CLOSED, ""
         
         # Create Updates content
         content = html.Div([
@@ -1282,10 +1381,10 @@ def toggle_updates_panel(updates_clicks, close_clicks, current_style):
                     'font-weight': 'bold'
                 }),
                 html.Ul([
-                    html.Li("Added visual feedback: selected projects now highlight with blue map dots_Suggestion JKO_", style={'margin-bottom': '8px', 'line-height': '1.4'}),
-                    html.Li("Implemented responsive layout with percentage-based sizing for better cross-device compatibility", style={'margin-bottom': '8px', 'line-height': '1.4'}),
-                    html.Li("Added project selection state tracking across map and sidebar interactions", style={'margin-bottom': '8px', 'line-height': '1.4'})
-                ], style={'padding-left': '20px', 'color': '#555', 'font-size': '13px'})
+                    html.Li("Added visual feedback: selected projects now highlight with blue map dots_Suggestion JKO_", style=_UPDATE_ITEM_STYLE),
+                    html.Li("Implemented responsive layout with percentage-based sizing for better cross-device compatibility", style=_UPDATE_ITEM_STYLE),
+                    html.Li("Added project selection state tracking across map and sidebar interactions", style=_UPDATE_ITEM_STYLE)
+                ], style=_UPDATE_LIST_STYLE)
             ], style={'margin-bottom': '25px'}),
             
             html.Div([
@@ -1296,44 +1395,100 @@ def toggle_updates_panel(updates_clicks, close_clicks, current_style):
                     'font-weight': 'bold'
                 }),
                 html.Ul([
-                    html.Li("Launched database", style={'margin-bottom': '8px', 'line-height': '1.4'})
-                ], style={'padding-left': '20px', 'color': '#555', 'font-size': '13px'})
+                    html.Li("Launched database", style=_UPDATE_ITEM_STYLE)
+                ], style=_UPDATE_LIST_STYLE)
             ])
         ])
         
-        return {**current_style, 'right': '0px'}, content
+        return _UPDATES_PANEL_OPEN, content
+    
+    return dash.no_update, dash.no_update
+
+# Fixed first system message of every chat request, so OpenAI can cache the prompt prefix
+_CHAT_SYSTEM_PROMPT = """You are a charming and witty 3D printing construction analyst. Be engaging, throw in occasional jokes or fascinating random facts about construction or 3D printing. 
+
+When first greeted, warmly welcome users and explain they can explore this interactive database of 3D printing construction projects. Mention that the database is still under development and that you (the AI) are still learning too! Encourage them to help by submitting feedback or adding projects using the links above. Then ask them (without giving away the answer!) when they think the very first 3D printing construction project happened - they might be surprised by how far back it goes!
+
+HISTORICAL CONTEXT: The first 3D printing construction patent was by Ralph Baker in 1925 (WAAM concept), and William Urschel built the first actual 3D printed building in 1939. Don't mention 1980s - that's for plastic printing, not construction.
+
+Be conversational and entertaining while staying informative. Avoid mentioning specific organizations, companies, or countries unless specifically asked. Mix in interesting facts, light humor, or construction/engineering trivia. Keep responses to 2-3 sentences but make them memorable. Always finish your complete thought within the token limit."""
+
+# Build the chat's dataset summary for a filter state
+def build_chat_context(material, start_year, end_year):
+    # Year rows of the count table inside the filter range
+    first_row = max(int(start_year) - _YEAR_MIN, 0)
+    last_row = max(int(end_year) - _YEAR_MIN + 1, 0)
+    counts = _YEAR_MATERIAL_COUNTS[first_row:last_row]
+    if material != 'all':
+        # Unknown categories map to -2, which matches no column
+        counts = counts * (np.arange(counts.shape[1]) == _MATERIAL_CODE_LOOKUP.get(material, -2))
+    
+    # Create data analysis for AI
+    material_counts = counts.sum(axis=0)
+    total_projects = int(material_counts.sum())
     
-    return current_style, ""
+    # Top materials; a stable sort keeps value_counts' tie order (category order)
+    top_materials = np.argsort(-material_counts, kind='stable')[:5]
+    material_analysis = []
+    for code in top_materials[material_counts[top_materials] > 0]:
+        count = material_counts[code]
+        percentage = (count / total_projects * 100) if total_projects > 0 else 0
+        material_analysis.append(f"{_MATERIAL_CATEGORY_NAMES[code]}: {count} ({percentage:.0f}%)")
+    
+    # Year trend analysis over the years that have projects, in year order
+    year_stats = counts.sum(axis=1)
+    year_stats = year_stats[year_stats > 0]
+    year_trend = "No clear trend"
+    if len(year_stats) > 1:
+        recent_years = year_stats[-3:].mean() if len(year_stats) >= 3 else year_stats[-1]
+        early_years = year_stats[:3].mean() if len(year_stats) >= 3 else year_stats[0]
+        if recent_years > early_years * 1.5:
+            year_trend = "Growing rapidly in recent years"
+        elif recent_years < early_years * 0.7:
+            year_trend = "Declining in recent years"
+        else:
+            year_trend = "Steady activity over time"
+    
+    # Per-filter part of the AI context
+    return f"""CURRENT DATASET ({total_projects} projects):
+- Filter: {material if material != 'all' else 'All materials'} | Years: {start_year}-{end_year}
+
+TOP MATERIALS: {'; '.join(material_analysis[:3])}
+TREND: {year_trend}"""
+
 # Chat callback with filter control, dynamic analysis, and EASTER EGG
 @app.callback(
-    [Output('chat-display', 'children'),
+    [Output('chat-response-store', 'data'),
      Output('chat-input', 'value'),
      Output('material-filter', 'value'),
      Output('year-filter', 'value'),
-     Output('chat-history-store', 'children')],
+     Output('chat-history-store', 'data')],
     [Input('chat-send', 'n_clicks'),
      Input('chat-input', 'n_submit')],
     [State('chat-input', 'value'),
-     State('chat-display', 'children'),
      State('material-filter', 'value'),
      State('year-filter', 'value'),
-     State('chat-history-store', 'children')]
+     State('chat-history-store', 'data')],
+    background=True,
+    # Lock the input while a reply is pending
+    running=[(Output('chat-send', 'disabled'), True, False),
+             (Output('chat-input', 'disabled'), True, False)],
+    progress=Output('chat-stream-store', 'data'),
+    interval=250,  # Poll often enough for the streamed reply to read smoothly
+    prevent_initial_call=True
 )
-def update_chat_with_filters(n_clicks, n_submit, message, current_chat, current_material, current_year_range, stored_history):
+def update_chat_with_filters(set_progress, n_clicks, n_submit, message, current_material, current_year_range, stored_history):
     if not (n_clicks or n_submit) or not message:
-        return current_chat or [], "", current_material, current_year_range, stored_history
+        return (dash.no_update,) * 5
+    
+    # Turn counter, so repeated identical exchanges still register clientside
+    turn = (n_clicks or 0) + (n_submit or 0)
     
     try:
         # SECRET EASTER EGG: Check for Pizza Hawaii trigger
         message_clean = message.lower().replace(',', '').replace('.', '').replace('!', '')
-        pk_variations = [
-            'i am pk and i like pizza hawaii',
-            'i am pk and i love pizza hawaii', 
-            'im pk and i like pizza hawaii',
-            'im pk and i love pizza hawaii'
-        ]
         
-        if any(variation in message_clean for variation in pk_variations):
+        if _EASTER_EGG_RE.search(message_clean):
             prank_response = """...............,´¯­­`, .........,´¯`,....­­/ 
 ....../¯/.../..../ 
 ..../../.../..../­­..,-----, 
@@ -1350,21 +1505,8 @@ def update_chat_with_filters(n_clicks, n_submit, message, current_chat, current_
 
 This is a serious construction database."""
             
-            new_chat = (current_chat or []) + [
-                html.Div([
-                    html.B("You: ", style={'color': '#333'}),
-                    html.Span(message, style={'color': '#555'})
-                ], style={'margin-bottom': '3px', 'font-size': '9px'}),
-                html.Div([
-                    html.B("AI: ", style={'color': '#0066cc'}),
-                    html.Pre(prank_response, style={'color': '#333', 'font-family': 'monospace', 'font-size': '8px', 'line-height': '1.2'})
-                ], style={'margin-bottom': '6px', 'font-size': '9px'})
-            ]
-            
-            if len(new_chat) > 20:
-                new_chat = new_chat[-20:]
-            
-            return new_chat, "", current_material, current_year_range, stored_history
+            response = {'turn': turn, 'user': message, 'reply': prank_response, 'kind': 'pre'}
+            return response, "", dash.no_update, dash.no_update, dash.no_update
         
         # Regular processing continues...
         # Parse filter commands
@@ -1378,7 +1520,7 @@ This is a serious construction database."""
         
         if 'reset' in filter_commands:
             new_material = 'all'
-            new_year_range = [int(df['Year'].min()), int(df['Year'].max())] if not df.empty else [2015, 2025]
+            new_year_range = _FULL_YEAR_RANGE
             filter_applied = True
             filter_message = "🔄 Filters reset! Showing all projects."
         else:
@@ -1397,155 +1539,142 @@ This is a serious construction database."""
                     applied_filters.append(f"Years: {filter_commands['year_range'][0]}-{filter_commands['year_range'][1]}")
                 filter_message = f"🎯 Filters applied: {', '.join(applied_filters)}"
         
-        # Get filtered data for AI context
-        current_filtered = df.loc[
-            (df['Year'] >= new_year_range[0]) & 
-            (df['Year'] <= new_year_range[1])
-        ].copy()
-        if new_material != 'all':
-            current_filtered = current_filtered.loc[current_filtered['Material_Category'] == new_material].copy()
-        
-        api_key = load_api_key()
-        if not api_key:
+        if _OPENAI_CLIENT is None:
             error_msg = "🤖 AI assistant unavailable (API key not found)"
-            new_chat = (current_chat or []) + [
-                html.Div([
-                    html.B("You: ", style={'color': '#333'}),
-                    html.Span(message, style={'color': '#555'})
-                ], style={'margin-bottom': '3px', 'font-size': '9px'}),
-                html.Div([
-                    html.B("AI: ", style={'color': '#red'}),
-                    html.Span(error_msg, style={'color': '#red'})
-                ], style={'margin-bottom': '6px', 'font-size': '9px'})
-            ]
-            return new_chat, "", current_material, current_year_range, stored_history
-        
-        client = OpenAI(api_key=api_key)
-        
-        # Create data analysis for AI
-        total_projects = len(current_filtered)
-        
-        # Material breakdown
-        material_stats = current_filtered['Material_Category'].value_counts()
-        material_analysis = []
-        for material, count in material_stats.head(5).items():
-            percentage = (count / total_projects * 100) if total_projects > 0 else 0
-            material_analysis.append(f"{material}: {count} ({percentage:.0f}%)")
-        
-        # Country analysis
-        country_stats = current_filtered['Country'].value_counts()
-        country_analysis = []
-        for country, count in country_stats.head(5).items():
-            percentage = (count / total_projects * 100) if total_projects > 0 else 0
-            country_analysis.append(f"{country}: {count} ({percentage:.0f}%)")
-        
-        # Year trend analysis
-        year_stats = current_filtered['Year'].value_counts().sort_index()
-        year_trend = "No clear trend"
-        if len(year_stats) > 1:
-            recent_years = year_stats.tail(3).mean() if len(year_stats) >= 3 else year_stats.iloc[-1]
-            early_years = year_stats.head(3).mean() if len(year_stats) >= 3 else year_stats.iloc[0]
-            if recent_years > early_years * 1.5:
-                year_trend = "Growing rapidly in recent years"
-            elif recent_years < early_years * 0.7:
-                year_trend = "Declining in recent years"
-            else:
-                year_trend = "Steady activity over time"
-        
-        # Organization analysis
-        org_stats = current_filtered['Organization'].value_counts()
-        top_org = org_stats.index[0] if len(org_stats) > 0 else "None"
-        top_org_count = org_stats.iloc[0] if len(org_stats) > 0 else 0
-        
-        # AI context
-        data_context = f"""You are a charming and witty 3D printing construction analyst. Be engaging, throw in occasional jokes or fascinating random facts about construction or 3D printing. 
-
-When first greeted, warmly welcome users and explain they can explore this interactive database of 3D printing construction projects. Mention that the database is still under development and that you (the AI) are still learning too! Encourage them to help by submitting feedback or adding projects using the links above. Then ask them (without giving away the answer!) when they think the very first 3D printing construction project happened - they might be surprised by how far back it goes!
-
-HISTORICAL CONTEXT: The first 3D printing construction patent was by Ralph Baker in 1925 (WAAM concept), and William Urschel built the first actual 3D printed building in 1939. Don't mention 1980s - that's for plastic printing, not construction.
-
-CURRENT DATASET ({total_projects} projects):
-- Filter: {new_material if new_material != 'all' else 'All materials'} | Years: {new_year_range[0]}-{new_year_range[1]}
-
-TOP MATERIALS: {'; '.join(material_analysis[:3])}
-TREND: {year_trend}
-
-Be conversational and entertaining while staying informative. Avoid mentioning specific organizations, companies, or countries unless specifically asked. Mix in interesting facts, light humor, or construction/engineering trivia. Keep responses to 2-3 sentences but make them memorable. Always finish your complete thought within the token limit."""  
-        # Chat history management
-        if stored_history:
-            try:
-                history = eval(stored_history) if isinstance(stored_history, str) else stored_history
-            except:
-                history = []
-        else:
-            history = []
+            response = {'turn': turn, 'user': message, 'reply': error_msg, 'kind': 'error'}
+            return response, "", dash.no_update, dash.no_update, dash.no_update
         
-        history.append({"role": "user", "content": message})
+        client = _OPENAI_CLIENT
         
-        if len(history) > 6:
-            history = history[-6:]
+        # Dataset summary for the current filters
+        data_context = build_chat_context(new_material, new_year_range[0], new_year_range[1])
         
-        # Prepare messages
-        messages = [{"role": "system", "content": data_context}] + history
+        # Chat history management - newest _CHAT_HISTORY_LIMIT messages including this turn
+        history = list(stored_history or [])[1 - _CHAT_HISTORY_LIMIT:]
         
         if filter_applied:
             current_message = f"Filter applied: {filter_message}. {message}"
         else:
             current_message = message
         
-        messages[-1] = {"role": "user", "content": current_message}
-        
-        # GPT-3.5-turbo call
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=messages,
-            max_tokens=100,
-            temperature= 0.8
-        )
+        # Prepare messages (the filter note is not kept in the history)
+        messages = [
+            {"role": "system", "content": _CHAT_SYSTEM_PROMPT},
+            {"role": "system", "content": data_context},
+            *history,
+            {"role": "user", "content": current_message}
+        ]
         
-        ai_response = response.choices[0].message.content.strip()
+        # Reuse the reply only for an identical prompt
+        prompt_digest = hashlib.sha1(json.dumps(messages).encode()).hexdigest()
+        reply_key = (_WHITESPACE_RE.sub(' ', message.strip().lower()), prompt_digest)
+        ai_response = _CHAT_REPLY_CACHE.get(reply_key)
         
-        history.append({"role": "assistant", "content": ai_response})
+        if ai_response is None:
+            # GPT-4o mini call, streamed
+            stream = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                max_tokens=100,
+                temperature= 0.8,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+            
+            parts = []
+            for chunk in stream:
+                # Only the final chunk carries usage; log it to see prompt cache hits
+                if chunk.usage:
+                    details = chunk.usage.prompt_tokens_details
+                    cached_tokens = (details.cached_tokens if details else None) or 0
+                    print(f"Chat usage: {chunk.usage.prompt_tokens} prompt tokens, {cached_tokens} cached")
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    partial = ''.join(parts).lstrip()
+                    if filter_applied:
+                        partial = f"{filter_message}\n\n{partial}"
+                    set_progress({'turn': turn, 'user': message, 'reply': partial, 'kind': 'ai'})
+            
+            ai_response = ''.join(parts).strip()
+            _CHAT_REPLY_CACHE.set(reply_key, ai_response, expire=_CHAT_REPLY_TTL)
         
-        if len(history) > 6:
-            history = history[-6:]
+        history = history[2 - _CHAT_HISTORY_LIMIT:] + [
+            {"role": "user", "content": message},
+            {"role": "assistant", "content": ai_response}
+        ]
         
         if filter_applied:
             ai_response = f"{filter_message}\n\n{ai_response}"
         
-        # Update chat display
-        new_chat = (current_chat or []) + [
-            html.Div([
-                html.B("You: ", style={'color': '#333'}),
-                html.Span(message, style={'color': '#555'})
-            ], style={'margin-bottom': '3px', 'font-size': '9px'}),
-            html.Div([
-                html.B("AI: ", style={'color': '#0066cc'}),
-                html.Span(ai_response, style={'color': '#333'})
-            ], style={'margin-bottom': '6px', 'font-size': '9px'})
-        ]
-        
-        if len(new_chat) > 20:
-            new_chat = new_chat[-20:]
-        
-        return new_chat, "", new_material, new_year_range, str(history)
+        response = {'turn': turn, 'user': message, 'reply': ai_response, 'kind': 'ai'}
+        return response, "", new_material, new_year_range, history
         
     except Exception as e:
         error_msg = f"🚨 AI error: {str(e)[:50]}..."
-        new_chat = (current_chat or []) + [
-            html.Div([
-                html.B("You: ", style={'color': '#333'}),
-                html.Span(message, style={'color': '#555'})
-            ], style={'margin-bottom': '3px', 'font-size': '9px'}),
-            html.Div([
-                html.B("AI: ", style={'color': '#red'}),
-                html.Span(error_msg, style={'color': '#red'})
-            ], style={'margin-bottom': '6px', 'font-size': '9px'})
-        ]
-        return new_chat, "", current_material, current_year_range, stored_history
+        response = {'turn': turn, 'user': message, 'reply': error_msg, 'kind': 'error'}
+        return response, "", dash.no_update, dash.no_update, dash.no_update
 
-# CSS
-app.index_string = '''
+# Render the chat from the browser-side log; streamed partials are drawn but not stored
+app.clientside_callback(
+    """
+    function(response, partial, log) {
+        var noUpdate = window.dash_clientside.no_update;
+        var triggered = window.dash_clientside.callback_context.triggered;
+        var fired = function(propId) {
+            return triggered.some(function(t) { return t.prop_id === propId; });
+        };
+        // The last progress update can arrive together with the response;
+        // the response wins so the finished exchange is stored
+        var streaming = !fired('chat-response-store.data') && fired('chat-stream-store.data');
+        log = log || [];
+        var entries;
+        if (streaming) {
+            // Skip the empty store and late updates for a turn that has
+            // already been answered
+            var lastTurn = log.length ? log[log.length - 1].turn : null;
+            if (!partial || partial.turn === lastTurn) {
+                return [noUpdate, noUpdate];
+            }
+            entries = log.concat([partial]);
+        } else {
+            if (!response) {
+                return [noUpdate, noUpdate];
+            }
+            log = entries = log.concat([response]).slice(-%(visible)d);
+        }
+        var el = function(type, children, style) {
+            return {namespace: 'dash_html_components', type: type, props: {children: children, style: style}};
+        };
+        var messages = [];
+        entries.slice(-%(visible)d).forEach(function(entry) {
+            var replyColor = entry.kind === 'error' ? '#red' : '#333';
+            var reply = entry.kind === 'pre'
+                ? el('Pre', entry.reply, {'color': '#333', 'font-family': 'monospace', 'font-size': '8px', 'line-height': '1.2'})
+                : el('Span', entry.reply, {'color': replyColor});
+            messages.push(
+                el('Div', [
+                    el('B', 'You: ', {'color': '#333'}),
+                    el('Span', entry.user, {'color': '#555'})
+                ], {'margin-bottom': '3px', 'font-size': '9px'}),
+                el('Div', [
+                    el('B', 'AI: ', {'color': entry.kind === 'error' ? '#red' : '#0066cc'}),
+                    reply
+                ], {'margin-bottom': '6px', 'font-size': '9px'})
+            );
+        });
+        return [streaming ? noUpdate : log, messages];
+    }
+    """ % {'visible': _CHAT_VISIBLE_EXCHANGES},
+    [Output('chat-log-store', 'data'),
+     Output('chat-display', 'children')],
+    [Input('chat-response-store', 'data'),
+     Input('chat-stream-store', 'data')],
+    State('chat-log-store', 'data')
+)
+
+# CSS (the <style> block is minified once at import)
+_INDEX_TEMPLATE = '''
 <!DOCTYPE html>
 <html>
     <head>
@@ -1593,6 +1722,11 @@ app.index_string = '''
     </body>
 </html>
 '''
+app.index_string = re.sub(
+    r'(<style>)(.*?)(</style>)',
+    lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3),
+    _INDEX_TEMPLATE, flags=re.S
+)
 
 # PRODUCTION: Updated for deployment
 if __name__ == '__main__':